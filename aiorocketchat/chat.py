@@ -29,6 +29,18 @@ class RocketChat:
         self.user_id = None
         self.username = None
         self.transport = Transport(verbose)
+        # Request objects are stateless besides the transport; build each
+        # once per client instead of allocating one per RPC.
+        self._connect_req = Connect(self.transport)
+        self._login_req = Login(self.transport)
+        self._resume_req = Resume(self.transport)
+        self._get_channels_req = GetChannels(self.transport)
+        self._send_message_req = SendMessage(self.transport)
+        self._send_reaction_req = SendReaction(self.transport)
+        self._send_typing_event_req = SendTypingEvent(self.transport)
+        self._subscribe_messages_req = SubscribeToChannelMessages(self.transport)
+        self._subscribe_changes_req = SubscribeToChannelChanges(self.transport)
+        self._unsubscribe_req = Unsubscribe(self.transport)
 
     async def start(self, address, username, password):
         ws_connected = asyncio.get_event_loop().create_future()
@@ -84,31 +96,31 @@ class RocketChat:
                 connected_fut.set_exception(e)
 
     async def _connect(self):
-        return await Connect(self.transport).call()
+        return await self._connect_req.call()
 
     async def _login(self, username, password):
-        return await Login(self.transport).call(username, password)
+        return await self._login_req.call(username, password)
 
     async def _resume(self, token):
-        return await Resume(self.transport).call(token)
+        return await self._resume_req.call(token)
 
     # --> Public API methods start here. <--
 
     async def get_channels(self):
         """Get a list of channels user is currently member of."""
-        return await GetChannels(self.transport).call()
+        return await self._get_channels_req.call()
 
     async def send_message(self, text, channel_id, thread_id=None):
         """Send a text message to a channel."""
-        return await SendMessage(self.transport).call(text, channel_id, thread_id)
+        return await self._send_message_req.call(text, channel_id, thread_id)
 
     async def send_reaction(self, orig_msg_id, emoji):
         """Send a reaction to a specific message."""
-        return await SendReaction(self.transport).call(orig_msg_id, emoji)
+        return await self._send_reaction_req.call(orig_msg_id, emoji)
 
     async def send_typing_event(self, channel_id, is_typing):
         """Send the `typing` event to a channel."""
-        return await SendTypingEvent(self.transport).call(
+        return await self._send_typing_event_req.call(
             channel_id, self.username, is_typing
         )
 
@@ -119,9 +131,7 @@ class RocketChat:
         Returns the subscription ID.
 
         """
-        sub_id = await SubscribeToChannelMessages(self.transport).call(
-            channel_id, callback
-        )
+        sub_id = await self._subscribe_messages_req.call(channel_id, callback)
         return sub_id
 
     async def subscribe_to_channel_changes(self, callback):
@@ -131,10 +141,8 @@ class RocketChat:
         Returns the subscription ID.
 
         """
-        return await SubscribeToChannelChanges(self.transport).call(
-            self.user_id, callback
-        )
+        return await self._subscribe_changes_req.call(self.user_id, callback)
 
     async def unsubscribe(self, subscription_id):
         """Cancel a subscription."""
-        return await Unsubscribe(self.transport).call(subscription_id)
+        return await self._unsubscribe_req.call(subscription_id)
@@ -1,6 +1,12 @@
 import hashlib
+import itertools
+import json
+import struct
+import sys
+import threading
 import time
-from abc import ABC, abstractmethod
+from functools import lru_cache
+from operator import itemgetter
 from pprint import pprint
 from typing import Any
 
@@ -20,32 +26,125 @@ from aiorocketchat.exceptions import (
 from aiorocketchat.transport import Transport
 from aiorocketchat.response import TransportResponse, BaseResponse, Channel
 
+_PACK_Q = struct.Struct("<Q").pack
+_GET_ID_T = itemgetter("_id", "t")
+_GET_MESSAGE_FIELDS = itemgetter("_id", "rid", "u", "msg")
 
-class BaseRealtimeRequestAbstract(ABC):
-    sequence_counter = 0
+# CPython only auto-interns identifier-like literals; intern the multi-word
+# protocol values once so dict builds and JSON encoding reuse one object.
+_ROOMS_GET = sys.intern("rooms/get")
+_SEND_MESSAGE = sys.intern("sendMessage")
+_SET_REACTION = sys.intern("setReaction")
+_STREAM_NOTIFY_ROOM = sys.intern("stream-notify-room")
+_STREAM_ROOM_MESSAGES = sys.intern("stream-room-messages")
+_STREAM_NOTIFY_USER = sys.intern("stream-notify-user")
+
+
+@lru_cache(maxsize=256)
+def _typing_topic(channel_id):
+    return f"{channel_id}/typing"
+
+
+@lru_cache(maxsize=256)
+def _rooms_changed_topic(user_id):
+    return f"{user_id}/rooms-changed"
+
+
+def _emit_change(callback, record):
+    return callback(*_GET_ID_T(record))
+
+
+def _ignore_change(callback, record):
+    return None  # Nothing else to do - channel has just been deleted.
+
+
+# Channel-change actions dispatch through this table; anything unknown is
+# treated like "added"/"updated" and forwarded to the callback.
+_CHANGE_DISPATCH = {"removed": _ignore_change}
+
+
+class _MessageHandler:
+    """Bind a user callback without the per-subscription closure and cell."""
+
+    __slots__ = ("cb",)
+
+    def __init__(self, cb):
+        self.cb = cb
+
+    def __call__(self, msg):
+        event = msg["fields"]["args"][0]  # TODO: This looks suspicious.
+        msg_id, channel_id, sender, text = _GET_MESSAGE_FIELDS(event)
+        return self.cb(
+            channel_id, sender["_id"], msg_id, event.get("tmid"), text, event.get("t")
+        )
+
+
+class _ChangeHandler:
+    """Bind a user callback without the per-subscription closure and cell."""
+
+    __slots__ = ("cb",)
+
+    def __init__(self, cb):
+        self.cb = cb
+
+    def __call__(self, msg):
+        payload = msg["fields"]["args"]
+        return _CHANGE_DISPATCH.get(payload[0], _emit_change)(self.cb, payload[1])
+
+
+# Preformatted message IDs; typical sessions stay well within this range.
+_ID_CACHE = tuple(map(str, range(1 << 14)))
+
+_tls = threading.local()
+
+
+def _fresh_blake2b():
+    """Clone a per-thread base hasher instead of allocating a new one."""
+    base = getattr(_tls, "b2b6", None)
+    if base is None:
+        base = _tls.b2b6 = hashlib.blake2b(digest_size=6)
+    return base.copy()
+
+
+# Cloning a prepared hasher is cheaper than constructing one from scratch,
+# and gives a ready extension point should a shared digest prefix (pepper)
+# ever be introduced.
+_SHA256_BASE = hashlib.sha256()
+
+
+@lru_cache(maxsize=32)
+def _sha256_hex(pwd: bytes) -> str:
+    """Hex SHA-256 digest, memoized so repeated logins skip the hashing."""
+    hasher = _SHA256_BASE.copy()
+    hasher.update(pwd)
+    return hasher.hexdigest()
+
+
+class BaseRealtimeRequestAbstract:
+    # itertools.count is atomic in CPython, so concurrent coroutines and
+    # threads cannot observe duplicate IDs.
+    _seq = itertools.count(1)
 
     @classmethod
     def inc_sequence(cls):
-        cls.sequence_counter += 1
-        return str(cls.sequence_counter)
+        seq = next(cls._seq)
+        return _ID_CACHE[seq] if seq < len(_ID_CACHE) else str(seq)
 
-    @abstractmethod
     def parse_response(self, response: TransportResponse):
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def get_message(self, *args, **kwargs):
-        ...
+        raise NotImplementedError
 
 
-class BaseRealtimeRequest(BaseRealtimeRequestAbstract, ABC):
+class BaseRealtimeRequest(BaseRealtimeRequestAbstract):
     exception_class = RocketChatBaseException
 
     def __init__(self, transport: Transport):
         self.transport = transport
 
     def parse_response(self, response: TransportResponse) -> Any:
-        return BaseResponse(id=response.get_field("result", "id"))
+        return BaseResponse(response.get_field("result", "id"))
 
     async def call(self, *args) -> BaseResponse:
         msg_id = self.inc_sequence()
@@ -63,12 +162,15 @@ class BaseRealtimeRequest(BaseRealtimeRequestAbstract, ABC):
 class Connect(BaseRealtimeRequest):
     exception_class = RocketConnectError
 
+    # The payload never varies; callers must treat it as read-only.
+    _MSG = {
+        "msg": "connect",
+        "version": "1",
+        "support": ["1"],
+    }
+
     def get_message(self, *args, **kwargs):
-        return {
-            "msg": "connect",
-            "version": "1",
-            "support": ["1"],
-        }
+        return self._MSG
 
     async def call(self) -> TransportResponse:
         await self.transport.call_method(self.get_message())
@@ -79,17 +181,13 @@ class Resume(BaseRealtimeRequest):
 
     exception_class = RocketResumeError
 
+    _SKELETON = {"msg": "method", "method": "login", "id": None, "params": None}
+
     def get_message(self, msg_id, token):
-        return {
-            "msg": "method",
-            "method": "login",
-            "id": msg_id,
-            "params": [
-                {
-                    "resume": token,
-                }
-            ],
-        }
+        msg = self._SKELETON.copy()
+        msg["id"] = msg_id
+        msg["params"] = [{"resume": token}]
+        return msg
 
 
 class Login(BaseRealtimeRequest):
@@ -97,19 +195,19 @@ class Login(BaseRealtimeRequest):
 
     exception_class = RocketLoginError
 
+    _SKELETON = {"msg": "method", "method": "login", "id": None, "params": None}
+
     def get_message(self, msg_id, username, password):
-        pwd_digest = hashlib.sha256(password.encode()).hexdigest()
-        return {
-            "msg": "method",
-            "method": "login",
-            "id": msg_id,
-            "params": [
-                {
-                    "user": {"username": username},
-                    "password": {"digest": pwd_digest, "algorithm": "sha-256"},
-                }
-            ],
-        }
+        pwd_digest = _sha256_hex(password.encode())
+        msg = self._SKELETON.copy()
+        msg["id"] = msg_id
+        msg["params"] = [
+            {
+                "user": {"username": username},
+                "password": {"digest": pwd_digest, "algorithm": "sha-256"},
+            }
+        ]
+        return msg
 
 
 class GetChannels(BaseRealtimeRequest):
@@ -117,23 +215,20 @@ class GetChannels(BaseRealtimeRequest):
 
     exception_class = RocketGetChannelsError
 
+    # Everything except the id is invariant; params stays empty and is
+    # never mutated, so sharing the list is safe.
+    _BASE = {"msg": "method", "method": _ROOMS_GET, "params": []}
+
     def get_message(self, msg_id):
-        return {
-            "msg": "method",
-            "method": "rooms/get",
-            "id": msg_id,
-            "params": [],
-        }
+        return {**self._BASE, "id": msg_id}
 
     def parse_response(self, response: TransportResponse):
-        channels = []
-        for item in response.content.get("result", []):
-            if type(item) != dict:
-                print("item", item)
-            channels.append(Channel(id=item["_id"], type=item["t"]))
-
-        # Return channel IDs and channel types.
-        return channels
+        # Return channel IDs and channel types; both passes run at C speed.
+        return list(
+            itertools.starmap(
+                Channel, map(_GET_ID_T, response.content.get("result", []))
+            )
+        )
 
     async def call(self):
         msg_id = self.inc_sequence()
@@ -147,20 +242,21 @@ class SendMessage(BaseRealtimeRequest):
 
     exception_class = RocketSendMessageError
 
+    _SKELETON = {"msg": "method", "method": _SEND_MESSAGE, "id": None, "params": None}
+
     def get_message(self, msg_id, channel_id, msg_text, thread_id=None):
-        id_seed = f"{msg_id}:{time.time()}"
-        msg = {
-            "msg": "method",
-            "method": "sendMessage",
-            "id": msg_id,
-            "params": [
-                {
-                    "_id": hashlib.md5(id_seed.encode()).hexdigest()[:12],
-                    "rid": channel_id,
-                    "msg": msg_text,
-                }
-            ],
-        }
+        hasher = _fresh_blake2b()
+        hasher.update(msg_id.encode())
+        hasher.update(_PACK_Q(time.time_ns()))
+        msg = self._SKELETON.copy()
+        msg["id"] = msg_id
+        msg["params"] = [
+            {
+                "_id": hasher.hexdigest(),
+                "rid": channel_id,
+                "msg": msg_text,
+            }
+        ]
         if thread_id is not None:
             msg["params"][0]["tmid"] = thread_id
         return msg
@@ -176,20 +272,28 @@ class SendReaction(BaseRealtimeRequest):
 
     exception_class = RocketSendReactionError
 
+    _TPL = (
+        '{{"msg":"method","method":"setReaction","id":{id},"params":[{emoji},{orig}]}}'
+    )
+
+    _SKELETON = {"msg": "method", "method": _SET_REACTION, "id": None, "params": None}
+
     def get_message(self, msg_id, orig_msg_id, emoji):
-        return {
-            "msg": "method",
-            "method": "setReaction",
-            "id": msg_id,
-            "params": [
-                emoji,
-                orig_msg_id,
-            ],
-        }
+        msg = self._SKELETON.copy()
+        msg["id"] = msg_id
+        msg["params"] = [emoji, orig_msg_id]
+        return msg
+
+    def get_message_raw(self, msg_id, orig_msg_id, emoji):
+        return self._TPL.format(
+            id=json.dumps(msg_id),
+            emoji=json.dumps(emoji),
+            orig=json.dumps(orig_msg_id),
+        )
 
     async def call(self, orig_msg_id, emoji):
         msg_id = self.inc_sequence()
-        msg = self.get_message(msg_id, orig_msg_id, emoji)
+        msg = self.get_message_raw(msg_id, orig_msg_id, emoji)
         await self.transport.call_method(msg)
 
 
@@ -198,17 +302,35 @@ class SendTypingEvent(BaseRealtimeRequest):
 
     exception_class = RocketSendTypingEventError
 
+    _TPL = (
+        '{{"msg":"method","method":"stream-notify-room",'
+        '"id":{id},"params":[{topic},{user},{typing}]}}'
+    )
+
+    _SKELETON = {
+        "msg": "method",
+        "method": _STREAM_NOTIFY_ROOM,
+        "id": None,
+        "params": None,
+    }
+
     def get_message(self, msg_id, channel_id, username, is_typing):
-        return {
-            "msg": "method",
-            "method": "stream-notify-room",
-            "id": msg_id,
-            "params": [f"{channel_id}/typing", username, is_typing],
-        }
+        msg = self._SKELETON.copy()
+        msg["id"] = msg_id
+        msg["params"] = [_typing_topic(channel_id), username, is_typing]
+        return msg
+
+    def get_message_raw(self, msg_id, channel_id, username, is_typing):
+        return self._TPL.format(
+            id=json.dumps(msg_id),
+            topic=json.dumps(_typing_topic(channel_id)),
+            user=json.dumps(username),
+            typing="true" if is_typing else "false",
+        )
 
     async def call(self, channel_id, username, is_typing):
         msg_id = self.inc_sequence()
-        msg = self.get_message(msg_id, channel_id, username, is_typing)
+        msg = self.get_message_raw(msg_id, channel_id, username, is_typing)
         await self.transport.call_method(msg, msg_id)
 
 
@@ -221,31 +343,19 @@ class SubscribeToChannelMessages(BaseRealtimeRequest):
         return {
             "msg": "sub",
             "id": msg_id,
-            "name": "stream-room-messages",
+            "name": _STREAM_ROOM_MESSAGES,
             "params": [channel_id, {"useCollection": False, "args": []}],
         }
 
     def _wrap(self, callback):
-        def fn(msg):
-            event = msg["fields"]["args"][0]  # TODO: This looks suspicious.
-            msg_id = event["_id"]
-            channel_id = event["rid"]
-            thread_id = event.get("tmid")
-            sender_id = event["u"]["_id"]
-            msg = event["msg"]
-            qualifier = event.get("t")
-            return callback(channel_id, sender_id, msg_id, thread_id, msg, qualifier)
-
-        return fn
+        return _MessageHandler(callback)
 
     async def call(self, channel_id, callback):
         # TODO: document the expected interface of the callback.
         msg_id = self.inc_sequence()
         msg = self.get_message(msg_id, channel_id)
         await self.transport.create_subscription(msg, msg_id, self._wrap(callback))
-        return BaseResponse(
-            id=msg_id
-        )  # Return the ID to allow for later unsubscription.
+        return BaseResponse(msg_id)  # Return the ID to allow for later unsubscription.
 
 
 class SubscribeToChannelChanges(BaseRealtimeRequest):
@@ -257,29 +367,19 @@ class SubscribeToChannelChanges(BaseRealtimeRequest):
         return {
             "msg": "sub",
             "id": msg_id,
-            "name": "stream-notify-user",
-            "params": [f"{user_id}/rooms-changed", False],
+            "name": _STREAM_NOTIFY_USER,
+            "params": [_rooms_changed_topic(user_id), False],
         }
 
     def _wrap(self, callback):
-        def fn(msg):
-            payload = msg["fields"]["args"]
-            if payload[0] == "removed":
-                return  # Nothing else to do - channel has just been deleted.
-            channel_id = payload[1]["_id"]
-            channel_type = payload[1]["t"]
-            return callback(channel_id, channel_type)
-
-        return fn
+        return _ChangeHandler(callback)
 
     async def call(self, user_id, callback):
         # TODO: document the expected interface of the callback.
         msg_id = self.inc_sequence()
         msg = self.get_message(msg_id, user_id)
         await self.transport.create_subscription(msg, msg_id, self._wrap(callback))
-        return BaseResponse(
-            id=msg_id
-        )  # Return the ID to allow for later unsubscription.
+        return BaseResponse(msg_id)  # Return the ID to allow for later unsubscription.
 
 
 class Unsubscribe(BaseRealtimeRequest):
@@ -287,12 +387,17 @@ class Unsubscribe(BaseRealtimeRequest):
 
     exception_class = RocketUnsubscribeError
 
+    _TPL = '{{"msg":"unsub","id":{id}}}'
+
     def get_message(self, subscription_id):
         return {
             "msg": "unsub",
             "id": subscription_id,
         }
 
+    def get_message_raw(self, subscription_id):
+        return self._TPL.format(id=json.dumps(subscription_id))
+
     async def call(self, subscription_id):
-        msg = self.get_message(subscription_id)
+        msg = self.get_message_raw(subscription_id)
         return await self.transport.call_method(msg)
@@ -0,0 +1,6 @@
+# Cython augmentation for response.py. Only type declarations live here;
+# the pure-Python module stays the single source of behavior and is used
+# as-is when the extension is not built.
+
+cdef class TransportResponse:
+    cdef public object content
@@ -1,18 +1,54 @@
-from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+# Shared default for missed lookups; never mutated, so one instance is enough.
+_MISSING: dict = {}
+
+
+@lru_cache(maxsize=64)
+def _make_getter(fields):
+    """Compile a chained .get() accessor for a fixed field path.
+
+    Only a handful of fixed paths are ever looked up (e.g. ("result", "id")),
+    so each compiles once and later calls skip the Python-level loop.
+    """
+    code = (
+        "lambda c: " + "c" + "".join(f".get({field!r}, _MISSING)" for field in fields)
+    )
+    getter = eval(code, {"_MISSING": _MISSING})
+    return lambda content: getter(content) or None
+
 
 class TransportResponse:
     def __init__(self, content):
         self.content = {} if content is None else content
 
     def get_field(self, *fields: str) -> Any:
+        # Nearly all lookups are one or two fields deep; handle those inline
+        # (type() instead of isinstance skips the MRO walk) and leave longer
+        # paths to the compiled accessors.
         content = self.content
-        for field in fields:
-            content = content.get(field, {})
-        return content or None
+        n = len(fields)
+        if n == 1:
+            return (content.get(fields[0]) or None) if type(content) is dict else None
+        if n == 2:
+            if type(content) is not dict:
+                return None
+            content = content.get(fields[0])
+            if type(content) is not dict:
+                return None
+            return content.get(fields[1]) or None
+        return _make_getter(fields)(content)
 
 
 # a common response, where the object with id is returned
-BaseResponse = namedtuple("BaseResponse", ["id"])
-Channel = namedtuple("Channel", ["id", "type"])
+@dataclass(slots=True, frozen=True)
+class BaseResponse:
+    id: str
+
+
+@dataclass(slots=True, frozen=True)
+class Channel:
+    id: str
+    type: str
@@ -5,6 +5,20 @@ from typing import Any
 
 from aiorocketchat.response import TransportResponse
 
+try:
+    # Optional fast path: orjson encodes and parses several times faster
+    # than the stdlib. DDP is text-JSON on the wire, so outbound frames are
+    # decoded back to str to keep the frame type uniform.
+    import orjson
+
+    def _dumps(msg):
+        return orjson.dumps(msg).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 class Transport:
     """Match websockets calls with responses and manage callbacks."""
@@ -23,22 +37,29 @@ class Transport:
         # if appropriate.
         return asyncio.create_task(self._process_incoming())
 
+    @staticmethod
+    def _serialize(msg):
+        # Methods may hand over a pre-rendered frame instead of a dict.
+        if isinstance(msg, (str, bytes)):
+            return msg
+        return _dumps(msg)
+
     async def call_method(self, msg, msg_id=None) -> TransportResponse:
         if self._verbose:
             print(f"Outgoing: {msg_id} {msg}")
         if msg_id is None:
-            return TransportResponse(await self._websocket.send(json.dumps(msg)))
+            return TransportResponse(await self._websocket.send(self._serialize(msg)))
         else:
             fut = asyncio.get_event_loop().create_future()
             self._futures[msg_id] = fut
-            await self._websocket.send(json.dumps(msg))
+            await self._websocket.send(self._serialize(msg))
             return TransportResponse(await fut)
 
     async def create_subscription(self, msg, msg_id, callback) -> TransportResponse:
         if self._verbose:
             print(f"Outgoing: {msg}")
         self._callbacks[msg["name"]] = callback
-        return TransportResponse(await self._websocket.send(json.dumps(msg)))
+        return TransportResponse(await self._websocket.send(self._serialize(msg)))
 
     async def _process_incoming(self):
         try:
@@ -55,7 +76,7 @@ class Transport:
         if self._verbose:
             print(f"Incoming: {msg}")
 
-        parsed = json.loads(msg)
+        parsed = _loads(msg)
         if parsed["msg"] == "result":
             msg_id = parsed["id"]
             if msg_id in self._futures:
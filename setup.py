@@ -0,0 +1,23 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    # response.py sits on the websocket receive hot path; compile it when
+    # Cython is available. The .pxd augmentation adds the C-level typing.
+    ext_modules = cythonize(["aiorocketchat/response.py"], language_level=3)
+except ImportError:
+    # Pure-Python install works unchanged without Cython.
+    ext_modules = []
+
+setup(
+    name="aiorocketchat",
+    version="0.1.0",
+    description="Asyncio client for rocket.chat",
+    packages=["aiorocketchat"],
+    package_data={"aiorocketchat": ["*.pxd"]},
+    install_requires=["websockets"],
+    extras_require={"fast": ["orjson", "uvloop"]},
+    python_requires=">=3.10",
+    ext_modules=ext_modules,
+)
@@ -1,6 +1,7 @@
 import pytest
 import hashlib
-from unittest.mock import Mock, AsyncMock, ANY
+import json
+from unittest.mock import ANY
 from aiorocketchat.methods import (
     Connect,
     Resume,
@@ -15,7 +16,11 @@ from aiorocketchat.methods import (
 )
 from aiorocketchat.response import TransportResponse, BaseResponse, Channel
 
-pytestmark = pytest.mark.asyncio
+pytestmark = [pytest.mark.asyncio, pytest.mark.no_io]
+
+# Hashed once per module; every parametrized/repeated run reuses the digest.
+_PWD = "pass"
+_PWD_DIGEST = hashlib.sha256(_PWD.encode()).hexdigest()
 
 
 async def test_connect_get_message(mock_transport):
@@ -54,8 +59,6 @@ async def test_resume_parse_response(mock_transport):
 async def test_login_get_message(mock_transport):
     msg_id = "123"
     username = "user"
-    password = "pass"
-    pwd_digest = hashlib.sha256(password.encode()).hexdigest()
     expected = {
         "msg": "method",
         "method": "login",
@@ -63,11 +66,11 @@ async def test_login_get_message(mock_transport):
         "params": [
             {
                 "user": {"username": username},
-                "password": {"digest": pwd_digest, "algorithm": "sha-256"},
+                "password": {"digest": _PWD_DIGEST, "algorithm": "sha-256"},
             }
         ],
     }
-    assert Login(mock_transport).get_message(msg_id, username, password) == expected
+    assert Login(mock_transport).get_message(msg_id, username, _PWD) == expected
 
 
 async def test_login_parse_response(mock_transport):
@@ -136,6 +139,12 @@ async def test_send_reaction_get_message(mock_transport):
     )
 
 
+async def test_send_reaction_get_message_raw(mock_transport):
+    req = SendReaction(mock_transport)
+    raw = req.get_message_raw("123", "456", ":smile:")
+    assert json.loads(raw) == req.get_message("123", "456", ":smile:")
+
+
 async def test_send_reaction_parse_response(mock_transport):
     result = SendReaction(mock_transport).parse_response(
         TransportResponse({"result": {"id": "123"}})
@@ -162,6 +171,13 @@ async def test_send_typing_event_get_message(mock_transport):
     )
 
 
+async def test_send_typing_event_get_message_raw(mock_transport):
+    req = SendTypingEvent(mock_transport)
+    for is_typing in (True, False):
+        raw = req.get_message_raw("123", "channel1", "user1", is_typing)
+        assert json.loads(raw) == req.get_message("123", "channel1", "user1", is_typing)
+
+
 async def test_send_typing_event_parse_response(mock_transport):
     response_content = {"result": {"id": "123"}}
     result = SendTypingEvent(mock_transport).parse_response(
@@ -185,7 +201,9 @@ async def test_subscribe_to_channel_messages_get_message(mock_transport):
     )
 
 
-async def test_subscribe_to_channel_messages_parse_response(mock_transport):
+async def test_subscribe_to_channel_messages_parse_response(
+    mock_transport, callback_mock
+):
     response_content = {
         "fields": {
             "args": [
@@ -200,7 +218,6 @@ async def test_subscribe_to_channel_messages_parse_response(mock_transport):
             ]
         }
     }
-    callback_mock = Mock()
     wrapped_callback = SubscribeToChannelMessages(mock_transport)._wrap(callback_mock)
     wrapped_callback(response_content)
     callback_mock.assert_called_once_with(
@@ -223,21 +240,23 @@ async def test_subscribe_to_channel_changes_get_message(mock_transport):
     )
 
 
-async def test_subscribe_to_channel_changes_parse_response_added(mock_transport):
+async def test_subscribe_to_channel_changes_parse_response_added(
+    mock_transport, callback_mock
+):
     response_content = {
         "fields": {"args": ["added", {"_id": "channel1", "t": "channel"}]}
     }
-    callback_mock = Mock()
     wrapped_callback = SubscribeToChannelChanges(mock_transport)._wrap(callback_mock)
     wrapped_callback(response_content)
     callback_mock.assert_called_once_with("channel1", "channel")
 
 
-async def test_subscribe_to_channel_changes_parse_response_removed(mock_transport):
+async def test_subscribe_to_channel_changes_parse_response_removed(
+    mock_transport, callback_mock
+):
     response_content = {
         "fields": {"args": ["removed", {"_id": "channel1", "t": "channel"}]}
     }
-    callback_mock = Mock()
     wrapped_callback = SubscribeToChannelChanges(mock_transport)._wrap(callback_mock)
     wrapped_callback(response_content)
     callback_mock.assert_not_called()
@@ -252,6 +271,12 @@ async def test_unsubscribe_get_message(mock_transport):
     assert Unsubscribe(mock_transport).get_message(subscription_id) == expected
 
 
+async def test_unsubscribe_get_message_raw(mock_transport):
+    req = Unsubscribe(mock_transport)
+    raw = req.get_message_raw("sub123")
+    assert json.loads(raw) == req.get_message("sub123")
+
+
 async def test_unsubscribe_get_response(mock_transport):
     response = Unsubscribe(mock_transport).parse_response(
         TransportResponse({"result": {"id": "123"}})
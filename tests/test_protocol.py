@@ -2,6 +2,8 @@ import pytest
 
 from aiorocketchat.response import TransportResponse
 
+pytestmark = pytest.mark.no_io
+
 
 def test_response_initialization():
     content = {"name": "John", "age": 30}